@@ -51,7 +51,12 @@ def _wrap_methods_with_logging(backend_class: Type['Backend']) -> None:
     for component_class in component_classes:
         logger = logging.getLogger(component_class.__module__)
         interface_class = component_class.interface_class()
-        for method_name in interface_class.__abstractmethods__:
+        # Interfaces can also provide optional methods with a default implementation.
+        method_names = set(interface_class.__abstractmethods__) | {
+            name for name, value in vars(interface_class).items()
+            if inspect.isfunction(value) and not name.startswith("_")
+        }
+        for method_name in method_names:
             _wrap_method_with_logging(backend_class, method_name, logger)
 
 
@@ -1,15 +1,27 @@
 """Console helper classes."""
 import sys
-from typing import Dict, Optional, Type, TypeVar
+from typing import FrozenSet, Optional, Type, TypeVar
 
 T = TypeVar("T")
 
+_TRUE_STRINGS: FrozenSet[str] = frozenset({"true", "yes"})
+_FALSE_STRINGS: FrozenSet[str] = frozenset({"false", "no"})
+
 
 class Console:
     """A helper class for console backends."""
 
+    __slots__ = ("_descriptor", "_prefix", "_interactive")
+
     def __init__(self, descriptor: str) -> None:
-        self._descriptor = descriptor
+        self._descriptor = sys.intern(descriptor)
+        self._prefix = f"{self._descriptor}: "
+
+        # Whether the user can be prompted for input. Input only comes from stdin
+        # if _input has not been overridden, in which case stdin must be a tty.
+        self._interactive = type(self)._input is not Console._input or (
+            sys.stdin is not None and sys.stdin.isatty()
+        )
 
     def _print(self, string: str) -> None:
         """
@@ -34,7 +46,7 @@ class Console:
 
         :param message: Message to print to the user.
         """
-        self._print(f"{self._descriptor}: {message}")
+        self._print(self._prefix + message)
 
     def read(  # type: ignore
             self,
@@ -47,26 +59,28 @@ class Console:
 
         :param prompt: Prompt to display to the user.
         :param return_type: type to cast the input as, defaults to str.
-        :param check_stdin: Check if stdin is available is a tty.
+        :param check_stdin: Return False for bool prompts if stdin was not a tty
+            when the console was created. Consoles that override _input are
+            always treated as interactive.
         :returns: value of type 'return_type'.
         """
-        if check_stdin and return_type is bool and not sys.stdin.isatty():
+        if check_stdin and return_type is bool and not self._interactive:
             return False  # type: ignore
-        elif return_type is not None:
+        full_prompt = f"{self._prefix}{prompt}: "
+        if return_type is not None:
+            # We have to ignore the types on this function unfortunately,
+            # as static type checking is not powerful enough to confirm
+            # that it is correct at runtime.
+            convert = self._get_bool if return_type is bool else return_type
+            error = f"Unable to construct a {return_type.__name__} from '{{}}'"
             while True:
-                response = self._input(f"{self._descriptor}: {prompt}: ")
+                response = self._input(full_prompt)
                 try:
-                    # We have to ignore the types on this function unfortunately,
-                    # as static type checking is not powerful enough to confirm
-                    # that it is correct at runtime.
-                    if return_type == bool:
-                        return self._get_bool(response)  # type: ignore
-                    return return_type(response)  # type: ignore
+                    return convert(response)  # type: ignore
                 except ValueError:
-                    self.info(f"Unable to construct a {return_type.__name__}"
-                              f" from '{response}'")
+                    self.info(error.format(response))
         else:
-            self._input(f"{self._descriptor}: {prompt}: ")
+            self._input(full_prompt)
 
     @staticmethod
     def _get_bool(case: str) -> bool:
@@ -77,14 +91,10 @@ class Console:
         :return: boolean representation of case
         :raises ValueError: case is not a bool.
         """
-        response_map: Dict[str, bool] = {
-            "true": True,
-            "yes": True,
-            "false": False,
-            "no": False,
-        }
-        normalised = case.lower().strip()
-        if normalised not in response_map:
-            raise ValueError()
+        normalised = case.casefold().strip()
+        if normalised in _TRUE_STRINGS:
+            return True
+        elif normalised in _FALSE_STRINGS:
+            return False
         else:
-            return response_map[normalised]
+            raise ValueError()
@@ -2,9 +2,22 @@
 
 import logging
 from abc import abstractmethod
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import timedelta
-from threading import Lock
-from typing import Mapping, Optional, Set, Tuple, Type
+from threading import Lock, local
+from typing import (
+    ContextManager,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from serial.tools.list_ports_common import ListPortInfo
 
@@ -16,16 +29,34 @@ from j5.components import GPIOPinInterface, GPIOPinMode, LEDInterface
 
 LOGGER = logging.getLogger(__name__)
 
+# Pins 0 and 1 are used for serial comms.
+FIRST_DIGITAL_PIN = 2
+DIGITAL_PIN_IDS: Tuple[int, ...] = tuple(
+    range(FIRST_DIGITAL_PIN, ArduinoUno.FIRST_ANALOGUE_PIN),
+)
 
-class DigitalPinData:
-    """Contains data about a digital pin."""
+_DIGITAL_PIN_MODES: FrozenSet[GPIOPinMode] = frozenset({
+    GPIOPinMode.DIGITAL_INPUT,
+    GPIOPinMode.DIGITAL_INPUT_PULLUP,
+    GPIOPinMode.DIGITAL_OUTPUT,
+})
+_DIGITAL_INPUT_MODES: FrozenSet[GPIOPinMode] = frozenset({
+    GPIOPinMode.DIGITAL_INPUT,
+    GPIOPinMode.DIGITAL_INPUT_PULLUP,
+})
 
-    mode: GPIOPinMode
-    state: bool
+# Used in place of a lock by backends that are only accessed from one thread.
+_NULL_LOCK: ContextManager[object] = nullcontext()
 
-    def __init__(self, *, mode: GPIOPinMode, state: bool):
-        self.mode = mode
-        self.state = state
+
+class _BatchState(local):
+    """Digital pin updates deferred by batch(), kept separately for each thread."""
+
+    pending: Optional[List[int]] = None
+
+    # Stored pin modes and states from before the pending updates were made.
+    pin_modes: "array[int]"
+    pin_states: "array[int]"
 
 
 class ArduinoHardwareBackend(
@@ -45,6 +76,10 @@ class ArduinoHardwareBackend(
     }
     DEFAULT_TIMEOUT: timedelta = timedelta(milliseconds=1250)
 
+    # Serial comms only need to be locked if the backend is shared between threads.
+    # Subclasses that are only ever used from one thread can disable the lock.
+    THREAD_SAFE: bool = True
+
     @classmethod
     def is_arduino(cls, port: ListPortInfo) -> bool:
         """
@@ -65,8 +100,8 @@ class ArduinoHardwareBackend(
         # Find all serial ports.
         ports = cls.get_comports()
 
-        # Get a list of boards from the ports.
-        boards: Set[Board] = set()
+        # Serial number and device path of each Arduino.
+        candidates: List[Tuple[str, str]] = []
         for port in filter(cls.is_arduino, ports):
             if port.serial_number is None:
                 LOGGER.warning(
@@ -74,14 +109,33 @@ class ArduinoHardwareBackend(
                     f"Ignoring device as it is incompatible: {port.usb_info()}",
                 )
             else:
-                boards.add(
-                    cls.board(
-                        port.serial_number,
-                        cls(port.device),
-                    ),
-                )
+                candidates.append((port.serial_number, port.device))
+
+        if not candidates:
+            return set()
+
+        # Each backend waits for its board to respond during construction, so
+        # connect to all of the boards at once rather than one after another.
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            futures = [executor.submit(cls, device) for _, device in candidates]
+
+        errors = [
+            error for error in (future.exception() for future in futures)
+            if error is not None
+        ]
+        if errors:
+            # Close the ports of the boards that did respond, as they are discarded.
+            for future in futures:
+                if future.exception() is None:
+                    future.result()._serial.close()
+            raise errors[0]
+        backends = [future.result() for future in futures]
 
-        return boards
+        # Get a list of boards from the ports.
+        return {
+            cls.board(serial_number, backend)
+            for (serial_number, _), backend in zip(candidates, backends)
+        }
 
     def __init__(
             self,
@@ -96,13 +150,19 @@ class ArduinoHardwareBackend(
         )
 
         self.serial_port = serial_port
+        self._board_name = self.board.name
 
-        self._lock = Lock()
+        self._lock: ContextManager[object] = Lock() if self.THREAD_SAFE else _NULL_LOCK
 
-        self._digital_pins: Mapping[int, DigitalPinData] = {
-            i: DigitalPinData(mode=GPIOPinMode.DIGITAL_INPUT, state=False)
-            for i in range(2, ArduinoUno.FIRST_ANALOGUE_PIN)
-        }
+        # Mode and state of each digital pin, indexed by pin number - FIRST_DIGITAL_PIN.
+        num_digital_pins = len(DIGITAL_PIN_IDS)
+        self._pin_modes: array[int] = array(
+            "B", [GPIOPinMode.DIGITAL_INPUT] * num_digital_pins,
+        )
+        self._pin_states: array[int] = array("B", [False] * num_digital_pins)
+
+        # Pins awaiting an update whilst inside a batch() block.
+        self._batch_state = _BatchState()
 
     @property
     @abstractmethod
@@ -119,12 +179,88 @@ class ArduinoHardwareBackend(
         """
         Write the stored value of a digital pin to the Arduino.
 
-        Reads the state out of self._digital_pins.
+        Reads the mode and state out of self._pin_modes and self._pin_states.
 
         :param identifier: Pin number to update.
         """
         raise NotImplementedError  # pragma: nocover
 
+    def _update_digital_pins(self, identifiers: Iterable[int]) -> None:
+        """
+        Write the stored values of several digital pins to the Arduino.
+
+        Backends should override this to send all of the updates in a single
+        serial write where the firmware allows it, by queueing each command
+        with _write and then calling _flush once.
+
+        :param identifiers: Pin numbers to update.
+        """
+        for identifier in identifiers:
+            self._update_digital_pin(identifier)
+
+    def _queue_digital_pin_update(self, identifier: int) -> None:
+        """
+        Update a digital pin, or defer the update if we are inside a batch.
+
+        :param identifier: Pin number to update.
+        """
+        pending = self._batch_state.pending
+        if pending is not None:
+            pending.append(identifier)
+        else:
+            self._update_digital_pin(identifier)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group digital pin updates so that they are sent to the board together.
+
+        Changes to digital pin modes and states made inside the block are
+        stored immediately, but are only written to the board when the block
+        exits normally. If the block raises, the deferred updates are discarded
+        and the stored modes and states of those pins are restored.
+
+        Only updates made by the thread that entered the block are deferred.
+
+        :yields: nothing.
+        """
+        state = self._batch_state
+        if state.pending is not None:
+            # Nested batch, the outermost block will send the updates.
+            yield
+            return
+
+        state.pending = []
+        state.pin_modes = array("B", self._pin_modes)
+        state.pin_states = array("B", self._pin_states)
+        try:
+            yield
+        except BaseException:
+            # The board never received the pending updates.
+            for identifier in state.pending:
+                index = identifier - FIRST_DIGITAL_PIN
+                self._pin_modes[index] = state.pin_modes[index]
+                self._pin_states[index] = state.pin_states[index]
+            raise
+        else:
+            self._send_pending_digital_pin_updates()
+        finally:
+            state.pending = None
+
+    def _send_pending_digital_pin_updates(self) -> None:
+        """
+        Send any digital pin updates deferred by batch() to the board.
+
+        This should be called before reading from the board inside a batch, so
+        that the pins are read in their new modes.
+        """
+        state = self._batch_state
+        if state.pending:
+            self._update_digital_pins(list(dict.fromkeys(state.pending)))
+            state.pending.clear()
+            state.pin_modes = array("B", self._pin_modes)
+            state.pin_states = array("B", self._pin_states)
+
     @abstractmethod
     def _read_digital_pin(self, identifier: int) -> bool:
         """
@@ -153,34 +289,61 @@ class ArduinoHardwareBackend(
         :param pin_mode: mode to set the pin to.
         :raises NotSupportedByHardwareError: function not supported.
         """
-        digital_pin_modes = {
-            GPIOPinMode.DIGITAL_INPUT,
-            GPIOPinMode.DIGITAL_INPUT_PULLUP,
-            GPIOPinMode.DIGITAL_OUTPUT,
-        }
+        self._check_not_serial_pin(identifier)
         if identifier < ArduinoUno.FIRST_ANALOGUE_PIN:
             # Digital pin
-            if pin_mode in digital_pin_modes:
-                self._digital_pins[identifier].mode = pin_mode
-                self._update_digital_pin(identifier)
+            if pin_mode in _DIGITAL_PIN_MODES:
+                self._pin_modes[identifier - FIRST_DIGITAL_PIN] = pin_mode
+                self._queue_digital_pin_update(identifier)
                 return
         else:
             # Analogue pin
             if pin_mode is GPIOPinMode.ANALOGUE_INPUT:
                 return
         raise NotSupportedByHardwareError(
-            f"{self.board.name} does not support mode {pin_mode} on pin {identifier}.",
+            f"{self._board_name} does not support mode {pin_mode} on pin {identifier}.",
         )
 
+    def _bulk_set_digital_mode(
+            self,
+            identifiers: Iterable[int],
+            pin_mode: GPIOPinMode,
+    ) -> None:
+        """
+        Set several digital pins to the same hardware mode.
+
+        The updates are sent to the board together, see batch().
+
+        :param identifiers: pin numbers to set.
+        :param pin_mode: mode to set the pins to.
+        """
+        with self.batch():
+            for identifier in identifiers:
+                self.set_gpio_pin_mode(identifier, pin_mode)
+
+    def _check_not_serial_pin(self, identifier: int) -> None:
+        """
+        Check that a pin is not one of the pins used for serial comms.
+
+        :param identifier: pin number.
+        :raises NotSupportedByHardwareError: pin is used for serial comms.
+        """
+        if identifier < FIRST_DIGITAL_PIN:
+            raise NotSupportedByHardwareError(
+                f"Pin {identifier} is used for serial comms on the {self._board_name}.",
+            )
+
     def get_gpio_pin_mode(self, identifier: int) -> GPIOPinMode:
         """
         Get the hardware mode of a GPIO pin.
 
         :param identifier: pin number.
         :returns: mode of the pin.
+        :raises NotSupportedByHardwareError: pin is used for serial comms.
         """
+        self._check_not_serial_pin(identifier)
         if identifier < ArduinoUno.FIRST_ANALOGUE_PIN:
-            return self._digital_pins[identifier].mode
+            return GPIOPinMode(self._pin_modes[identifier - FIRST_DIGITAL_PIN])
 
         return GPIOPinMode.ANALOGUE_INPUT
 
@@ -193,15 +356,17 @@ class ArduinoHardwareBackend(
         :raises ValueError: pin is not in correct mode.
         :raises NotSupportedByHardwareError: function not supported.
         """
+        self._check_not_serial_pin(identifier)
         if identifier >= ArduinoUno.FIRST_ANALOGUE_PIN:
             raise NotSupportedByHardwareError(
                 "Digital functions not supported on analogue pins",
             )
-        if self._digital_pins[identifier].mode is not GPIOPinMode.DIGITAL_OUTPUT:
+        index = identifier - FIRST_DIGITAL_PIN
+        if self._pin_modes[index] != GPIOPinMode.DIGITAL_OUTPUT:
             raise ValueError(f"Pin {identifier} mode needs to be DIGITAL_OUTPUT "
                              f"in order to set the digital state.")
-        self._digital_pins[identifier].state = state
-        self._update_digital_pin(identifier)
+        self._pin_states[index] = state
+        self._queue_digital_pin_update(identifier)
 
     def get_gpio_pin_digital_state(self, identifier: int) -> bool:
         """
@@ -212,14 +377,16 @@ class ArduinoHardwareBackend(
         :raises ValueError: pin is not in correct mode.
         :raises NotSupportedByHardwareError: function not supported.
         """
+        self._check_not_serial_pin(identifier)
         if identifier >= ArduinoUno.FIRST_ANALOGUE_PIN:
             raise NotSupportedByHardwareError(
                 "Digital functions not supported on analogue pins.",
             )
-        if self._digital_pins[identifier].mode is not GPIOPinMode.DIGITAL_OUTPUT:
+        index = identifier - FIRST_DIGITAL_PIN
+        if self._pin_modes[index] != GPIOPinMode.DIGITAL_OUTPUT:
             raise ValueError(f"Pin {identifier} mode needs to be DIGITAL_OUTPUT "
                              f"in order to read the digital state.")
-        return self._digital_pins[identifier].state
+        return bool(self._pin_states[index])
 
     def read_gpio_pin_digital_state(self, identifier: int) -> bool:
         """
@@ -230,16 +397,15 @@ class ArduinoHardwareBackend(
         :raises ValueError: pin is not in correct mode.
         :raises NotSupportedByHardwareError: function not supported.
         """
+        self._check_not_serial_pin(identifier)
         if identifier >= ArduinoUno.FIRST_ANALOGUE_PIN:
             raise NotSupportedByHardwareError(
                 "Digital functions not supported on analogue pins.",
             )
-        if self._digital_pins[identifier].mode not in (
-            GPIOPinMode.DIGITAL_INPUT,
-            GPIOPinMode.DIGITAL_INPUT_PULLUP,
-        ):
+        if self._pin_modes[identifier - FIRST_DIGITAL_PIN] not in _DIGITAL_INPUT_MODES:
             raise ValueError(f"Pin {identifier} mode needs to be DIGITAL_INPUT_* "
                              f"in order to read the digital state.")
+        self._send_pending_digital_pin_updates()
         return self._read_digital_pin(identifier)
 
     def read_gpio_pin_analogue_value(self, identifier: int) -> float:
@@ -254,6 +420,7 @@ class ArduinoHardwareBackend(
             raise NotSupportedByHardwareError(
                 "Analogue functions not supported on digital pins.",
             )
+        self._send_pending_digital_pin_updates()
         return self._read_analogue_pin(identifier)
 
     def write_gpio_pin_dac_value(self, identifier: int, scaled_value: float) -> None:
@@ -264,7 +431,7 @@ class ArduinoHardwareBackend(
         :param scaled_value: scaled analogue value to write
         :raises NotSupportedByHardwareError: Arduino Uno does not have a DAC.
         """
-        raise NotSupportedByHardwareError(f"{self.board.name} does not have a DAC.")
+        raise NotSupportedByHardwareError(f"{self._board_name} does not have a DAC.")
 
     def write_gpio_pin_pwm_value(self, identifier: int, duty_cycle: float) -> None:
         """
@@ -275,7 +442,7 @@ class ArduinoHardwareBackend(
         :raises NotSupportedByHardwareError: Not implemented in  supported firmware yet.
         """
         raise NotSupportedByHardwareError(
-            f"{self.board.name} firmware does not implement PWM output.",
+            f"{self._board_name} firmware does not implement PWM output.",
         )
 
     def get_led_state(self, identifier: int) -> bool:
@@ -287,7 +454,7 @@ class ArduinoHardwareBackend(
         :raises ValueError: invalid LED identifier.
         """
         if identifier != 0:
-            raise ValueError(f"{self.board.name} only has LED 0 (digital pin 13).")
+            raise ValueError(f"{self._board_name} only has LED 0 (digital pin 13).")
         return self.get_gpio_pin_digital_state(13)
 
     def set_led_state(self, identifier: int, state: bool) -> None:
@@ -299,5 +466,5 @@ class ArduinoHardwareBackend(
         :raises ValueError: invalid LED identifier.
         """
         if identifier != 0:
-            raise ValueError(f"{self.board.name} only has LED 0 (digital pin 13).")
+            raise ValueError(f"{self._board_name} only has LED 0 (digital pin 13).")
         self.write_gpio_pin_digital_state(13, state)
@@ -36,6 +36,9 @@ class SerialHardwareBackend(Backend, metaclass=BackendMeta):
         except SerialException as e:
             raise CommunicationError(f"Serial Error: {e}") from e
 
+        # Data waiting to be written to the serial port by _flush.
+        self._write_buffer = bytearray()
+
     @classmethod
     @abstractmethod
     def discover(cls) -> Set[Board]:
@@ -69,6 +72,35 @@ class SerialHardwareBackend(Backend, metaclass=BackendMeta):
         """
         return Serial
 
+    def _write(self, data: bytes) -> None:
+        """
+        Queue data to be written to the serial interface.
+
+        The data is not sent until _flush is called, so that several commands
+        can be sent to the board in a single write.
+
+        :param data: data to write.
+        """
+        self._write_buffer += data
+
+    def _flush(self) -> None:
+        """
+        Write any queued data to the serial interface.
+
+        :raises CommunicationError: serial error whilst writing data.
+        """
+        if not self._write_buffer:
+            return
+
+        data = bytes(self._write_buffer)
+        self._write_buffer.clear()
+        try:
+            self._serial.write(data)
+        except SerialTimeoutException as e:
+            raise CommunicationError(f"Serial Timeout Error: {e}") from e
+        except SerialException as e:
+            raise CommunicationError(f"Serial Error: {e}") from e
+
     def read_serial_line(self, empty: bool = False) -> str:
         """
         Read a line from the serial interface.
@@ -1,13 +1,14 @@
 """SourceBots Arduino Hardware Implementation."""
 
 from datetime import timedelta
-from typing import List, Optional
-
-from serial import SerialException, SerialTimeoutException
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from j5.backends import CommunicationError
 from j5.backends.hardware.env import NotSupportedByHardwareError
-from j5.backends.hardware.j5.arduino import ArduinoHardwareBackend
+from j5.backends.hardware.j5.arduino import (
+    FIRST_DIGITAL_PIN,
+    ArduinoHardwareBackend,
+)
 from j5.boards.sb.arduino import SBArduinoBoard
 from j5.components import GPIOPinMode, ServoInterface, ServoPosition
 from j5.components.derived import UltrasoundInterface
@@ -69,59 +70,111 @@ class SBArduinoHardwareBackend(
         :param command: Command to send to the board:
         :param params: Additional parameters to the command.
         :returns: List of responses from the board.
-        :raises CommunicationError: An error occurred during the command execution.
-        """
-        try:
-            with self._lock:
-                message = " ".join([command] + list(params)) + "\n"
-                self._serial.write(message.encode("utf-8"))
-
-                results: List[str] = []
-                while True:
-                    line = self.read_serial_line(empty=False)
-                    code, param = line.split(None, 1)
-                    if code == "+":
-                        return results
-                    elif code == "-":
-                        raise CommunicationError(f"Arduino error: {param}")
-                    elif code == ">":
-                        results.append(param)
-                    elif code == "#":
-                        pass  # Ignore comment lines
-                    else:
-                        raise CommunicationError(
-                            f"Arduino returned unrecognised response line: {line}",
-                        )
-        except SerialTimeoutException as e:
-            raise CommunicationError(f"Serial Timeout Error: {e}") from e
-        except SerialException as e:
-            raise CommunicationError(f"Serial Error: {e}") from e
+        """
+        return self._commands([[command, *params]])[0]
+
+    def _commands(self, commands: Sequence[Sequence[str]]) -> List[List[str]]:
+        """
+        Send several commands to the board in a single write.
+
+        :param commands: Commands to send, each with any additional parameters.
+        :returns: List of responses from the board for each command.
+        :raises CommunicationError: The board reported an error for a command.
+        """
+        with self._lock:
+            try:
+                for command in commands:
+                    message = " ".join(command) + "\n"
+                    self._write(message.encode("utf-8"))
+                self._flush()
+            finally:
+                # Don't send a partly queued batch in front of the next command.
+                self._write_buffer.clear()
+
+            # Read the response to every command before raising an error reported
+            # by the board, otherwise the remaining responses would be read as
+            # replies to later commands.
+            responses: List[List[str]] = []
+            errors: List[str] = []
+            for _ in commands:
+                results, error = self._read_command_response()
+                responses.append(results)
+                if error is not None:
+                    errors.append(error)
+            if errors:
+                raise CommunicationError(f"Arduino error: {errors[0]}")
+            return responses
+
+    def _read_command_response(self) -> Tuple[List[str], Optional[str]]:
+        """
+        Read the response to a single command from the board.
+
+        :returns: List of responses from the board, and the error reported by the
+            board, if any.
+        :raises CommunicationError: The board returned an unrecognised response.
+        """
+        results: List[str] = []
+        while True:
+            line = self.read_serial_line(empty=False)
+            code, param = line.split(None, 1)
+            if code == "+":
+                return results, None
+            elif code == "-":
+                return results, param
+            elif code == ">":
+                results.append(param)
+            elif code == "#":
+                pass  # Ignore comment lines
+            else:
+                raise CommunicationError(
+                    f"Arduino returned unrecognised response line: {line}",
+                )
 
     def _update_digital_pin(self, identifier: int) -> None:
         """
         Write the stored value of a digital pin to the Arduino.
 
-        Reads the state out of self._digital_pins.
+        Reads the mode and state out of self._pin_modes and self._pin_states.
+
+        :param identifier: Pin number to update.
+        """
+        self._command(*self._digital_pin_command(identifier))
+
+    def _update_digital_pins(self, identifiers: Iterable[int]) -> None:
+        """
+        Write the stored values of several digital pins to the Arduino.
+
+        :param identifiers: Pin numbers to update.
+        """
+        self._commands([
+            self._digital_pin_command(identifier) for identifier in identifiers
+        ])
+
+    def _digital_pin_command(self, identifier: int) -> List[str]:
+        """
+        Build the command to write the stored value of a digital pin.
 
         :param identifier: Pin number to update.
-        :raises RuntimeError: Pin is an analogue pin.
+        :returns: Command and parameters to send to the board.
+        :raises RuntimeError: Pin is not a digital pin.
         """
-        if identifier >= SBArduinoBoard.FIRST_ANALOGUE_PIN:
+        if not FIRST_DIGITAL_PIN <= identifier < SBArduinoBoard.FIRST_ANALOGUE_PIN:
             raise RuntimeError("Reached an unreachable statement.")
-        pin = self._digital_pins[identifier]
+        index = identifier - FIRST_DIGITAL_PIN
+        mode = self._pin_modes[index]
         char: str
-        if pin.mode == GPIOPinMode.DIGITAL_INPUT:
+        if mode == GPIOPinMode.DIGITAL_INPUT:
             char = "Z"
-        elif pin.mode == GPIOPinMode.DIGITAL_INPUT_PULLUP:
+        elif mode == GPIOPinMode.DIGITAL_INPUT_PULLUP:
             char = "P"
-        elif pin.mode == GPIOPinMode.DIGITAL_OUTPUT:
-            if pin.state:
+        elif mode == GPIOPinMode.DIGITAL_OUTPUT:
+            if self._pin_states[index]:
                 char = "H"
             else:
                 char = "L"
         else:
             raise RuntimeError("Reached an unreachable statement.")
-        self._command("W", str(identifier), char)
+        return ["W", str(identifier), char]
 
     def _read_digital_pin(self, identifier: int) -> bool:
         """
@@ -208,21 +261,60 @@ class SBArduinoHardwareBackend(
         :param trigger_pin_identifier: pin number of the trigger pin.
         :param echo_pin_identifier: pin number of the echo pin.
         :returns: Time taken for the pulse, or None if it timed out.
+        """
+        microseconds = self._read_ultrasound_pulse_us(
+            trigger_pin_identifier,
+            echo_pin_identifier,
+        )
+        if microseconds is None:
+            return None
+        else:
+            return timedelta(microseconds=microseconds)
+
+    def get_ultrasound_pulse_us(
+        self,
+        trigger_pin_identifier: int,
+        echo_pin_identifier: int,
+    ) -> Optional[int]:
+        """
+        Get the ultrasound time as an integer number of microseconds.
+
+        :param trigger_pin_identifier: pin number of the trigger pin.
+        :param echo_pin_identifier: pin number of the echo pin.
+        :returns: Time taken for the pulse in microseconds, or None if it timed out.
+        """
+        return self._read_ultrasound_pulse_us(
+            trigger_pin_identifier,
+            echo_pin_identifier,
+        )
+
+    def _read_ultrasound_pulse_us(
+        self,
+        trigger_pin_identifier: int,
+        echo_pin_identifier: int,
+    ) -> Optional[int]:
+        """
+        Read the ultrasound time in microseconds from the Arduino.
+
+        :param trigger_pin_identifier: pin number of the trigger pin.
+        :param echo_pin_identifier: pin number of the echo pin.
+        :returns: Time taken for the pulse in microseconds, or None if it timed out.
         :raises CommunicationError: Invalid response from Arduino
         """
         self._check_ultrasound_pins(trigger_pin_identifier, echo_pin_identifier)
+        self._send_pending_digital_pin_updates()
         results = self._command("T", str(trigger_pin_identifier),
                                 str(echo_pin_identifier))
         self._update_ultrasound_pin_modes(trigger_pin_identifier, echo_pin_identifier)
         if len(results) != 1:
             raise CommunicationError(f"Invalid response from Arduino: {results!r}")
         result = results[0]
-        microseconds = float(result)
+        microseconds = round(float(result))
         if microseconds == 0:
             # arduino pulseIn() returned 0 which indicates a timeout.
             return None
         else:
-            return timedelta(microseconds=microseconds)
+            return microseconds
 
     def get_ultrasound_distance(
         self,
@@ -238,6 +330,7 @@ class SBArduinoHardwareBackend(
         :raises CommunicationError: Invalid response from Arduino
         """
         self._check_ultrasound_pins(trigger_pin_identifier, echo_pin_identifier)
+        self._send_pending_digital_pin_updates()
         results = self._command("U", str(trigger_pin_identifier),
                                 str(echo_pin_identifier))
         self._update_ultrasound_pin_modes(trigger_pin_identifier, echo_pin_identifier)
@@ -283,6 +376,8 @@ class SBArduinoHardwareBackend(
         :param trigger_pin_identifier: pin number of the trigger pin.
         :param echo_pin_identifier: pin number of the echo pin.
         """
-        self._digital_pins[trigger_pin_identifier].mode = GPIOPinMode.DIGITAL_OUTPUT
-        self._digital_pins[trigger_pin_identifier].state = False
-        self._digital_pins[echo_pin_identifier].mode = GPIOPinMode.DIGITAL_INPUT
+        trigger_index = trigger_pin_identifier - FIRST_DIGITAL_PIN
+        echo_index = echo_pin_identifier - FIRST_DIGITAL_PIN
+        self._pin_modes[trigger_index] = GPIOPinMode.DIGITAL_OUTPUT
+        self._pin_states[trigger_index] = False
+        self._pin_modes[echo_index] = GPIOPinMode.DIGITAL_INPUT
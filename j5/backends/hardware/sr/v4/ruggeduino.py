@@ -1,12 +1,14 @@
 """Student Robotics Ruggeduino Hardware Implementation."""
 
-from typing import List, Optional, Tuple
-
-from serial import SerialException, SerialTimeoutException
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from j5.backends import CommunicationError
 from j5.backends.hardware import NotSupportedByHardwareError
-from j5.backends.hardware.j5.arduino import ArduinoHardwareBackend
+from j5.backends.hardware.j5.arduino import (
+    DIGITAL_PIN_IDS,
+    FIRST_DIGITAL_PIN,
+    ArduinoHardwareBackend,
+)
 from j5.boards.sr.v4.ruggeduino import Ruggeduino
 from j5.components import GPIOPinMode, StringCommandComponentInterface
 
@@ -46,8 +48,7 @@ class SRV4RuggeduinoHardwareBackend(
                 f"expected \"1\".",
             )
 
-        for pin_number in self._digital_pins.keys():
-            self.set_gpio_pin_mode(pin_number, GPIOPinMode.DIGITAL_INPUT)
+        self._bulk_set_digital_mode(DIGITAL_PIN_IDS, GPIOPinMode.DIGITAL_INPUT)
 
     @property
     def firmware_version(self) -> str:
@@ -95,34 +96,59 @@ class SRV4RuggeduinoHardwareBackend(
         """
         Write the stored value of a digital pin to the Arduino.
 
-        Reads the state out of self._digital_pins.
+        Reads the mode and state out of self._pin_modes and self._pin_states.
 
         :param identifier: Pin number to update.
-        :raises RuntimeError: The identifier of an analogue pin was provided.
         """
-        if identifier >= Ruggeduino.FIRST_ANALOGUE_PIN:
+        for command in self._digital_pin_commands(identifier):
+            self._command(*command)
+
+    def _update_digital_pins(self, identifiers: Iterable[int]) -> None:
+        """
+        Write the stored values of several digital pins to the Arduino.
+
+        All of the commands are sent in a single write.
+
+        :param identifiers: Pin numbers to update.
+        """
+        commands = [
+            command + self.encode_pin(pin)
+            for identifier in identifiers
+            for command, pin in self._digital_pin_commands(identifier)
+        ]
+        self._execute_raw_string_commands(commands)
+
+    def _digital_pin_commands(self, identifier: int) -> List[Tuple[str, int]]:
+        """
+        Build the commands to write the stored value of a digital pin.
+
+        :param identifier: Pin number to update.
+        :returns: List of command and pin number pairs.
+        :raises RuntimeError: The identifier of a non-digital pin was provided.
+        """
+        if not FIRST_DIGITAL_PIN <= identifier < Ruggeduino.FIRST_ANALOGUE_PIN:
             raise RuntimeError("Reached an unreachable statement.")
 
-        pin = self._digital_pins[identifier]
+        index = identifier - FIRST_DIGITAL_PIN
+        mode = self._pin_modes[index]
 
         # List of command and pin number
         commands: List[Tuple[str, int]] = []
 
-        if pin.mode == GPIOPinMode.DIGITAL_INPUT:
+        if mode == GPIOPinMode.DIGITAL_INPUT:
             commands.append(("i", identifier))
-        elif pin.mode == GPIOPinMode.DIGITAL_INPUT_PULLUP:
+        elif mode == GPIOPinMode.DIGITAL_INPUT_PULLUP:
             commands.append(("p", identifier))
-        elif pin.mode == GPIOPinMode.DIGITAL_OUTPUT:
+        elif mode == GPIOPinMode.DIGITAL_OUTPUT:
             commands.append(("o", identifier))
-            if pin.state:
+            if self._pin_states[index]:
                 commands.append(("h", identifier))
             else:
                 commands.append(("l", identifier))
         else:
             raise RuntimeError("Reached an unreachable statement.")
 
-        for command in commands:
-            self._command(*command)
+        return commands
 
     def _read_digital_pin(self, identifier: int) -> bool:
         """
@@ -177,14 +203,23 @@ class SRV4RuggeduinoHardwareBackend(
 
         :param command: command to execute.
         :returns: result from ruggeduino
-        :raises CommunicationError: error occurred during ruggeduino comms.
-        """
-        try:
-            with self._lock:
-                self._serial.write(command.encode("utf-8"))
-                # Get all the characters in the input buffer
-                return self.read_serial_line(empty=True)
-        except SerialTimeoutException as e:
-            raise CommunicationError(f"Serial Timeout Error: {e}") from e
-        except SerialException as e:
-            raise CommunicationError(f"Serial Error: {e}") from e
+        """
+        return self._execute_raw_string_commands([command])[0]
+
+    def _execute_raw_string_commands(self, commands: Sequence[str]) -> List[str]:
+        """
+        Send several raw string commands to the Ruggeduino in a single write.
+
+        :param commands: commands to execute.
+        :returns: result from ruggeduino for each command.
+        """
+        with self._lock:
+            try:
+                for command in commands:
+                    self._write(command.encode("utf-8"))
+                self._flush()
+            finally:
+                # Don't send a partly queued batch in front of the next command.
+                self._write_buffer.clear()
+            # Get all the characters in the input buffer
+            return [self.read_serial_line(empty=True) for _ in commands]
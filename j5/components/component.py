@@ -13,6 +13,8 @@ class Interface(metaclass=ABCMeta):
 class Component(metaclass=ABCMeta):
     """A component is the smallest logical part of some hardware."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def identifier(self) -> int:
@@ -37,6 +39,8 @@ class DerivedComponent(Component):
     >>> u = Ultrasound(pin_0, pin_1)
     """
 
+    __slots__ = ()
+
     @property
     def identifier(self) -> int:
         """
@@ -32,6 +32,26 @@ class UltrasoundInterface(Interface):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def get_ultrasound_pulse_us(
+            self,
+            trigger_pin_identifier: int,
+            echo_pin_identifier: int,
+    ) -> Optional[int]:
+        """
+        Get the ultrasound time as an integer number of microseconds.
+
+        Backends that receive the time in microseconds should override this to
+        avoid constructing a timedelta.
+
+        :param trigger_pin_identifier: pin number of the trigger pin.
+        :param echo_pin_identifier: pin number of the echo pin.
+        :returns: Time taken for the pulse in microseconds, or None if it timed out.
+        """
+        pulse = self.get_ultrasound_pulse(trigger_pin_identifier, echo_pin_identifier)
+        if pulse is None:
+            return None
+        return pulse // timedelta(microseconds=1)
+
     @abstractmethod
     def get_ultrasound_distance(
             self,
@@ -56,6 +76,8 @@ class UltrasoundSensor(DerivedComponent):
     to a nearby object.
     """
 
+    __slots__ = ("_gpio_trigger", "_gpio_echo", "_backend", "_distance_mode")
+
     def __init__(
         self,
         gpio_trigger: GPIOPin,
@@ -65,8 +87,8 @@ class UltrasoundSensor(DerivedComponent):
         distance_mode: bool = True,
     ) -> None:
 
-        if self.__class__ not in gpio_trigger.firmware_modes or \
-                self.__class__ not in gpio_echo.firmware_modes:
+        cls = self.__class__
+        if cls not in gpio_trigger.firmware_modes or cls not in gpio_echo.firmware_modes:
             raise NotSupportedByComponentError(
                 f"Pins {gpio_trigger.identifier} and {gpio_echo.identifier}"
                 f" must support Ultrasound.",
@@ -97,6 +119,19 @@ class UltrasoundSensor(DerivedComponent):
             self._gpio_echo.identifier,
         )
 
+    def pulse_us(self) -> Optional[int]:
+        """
+        Send a pulse and return the time taken in microseconds.
+
+        This is cheaper than pulse() when polling the sensor in a tight loop.
+
+        :returns: Time taken for the pulse in microseconds, or None if it timed out.
+        """
+        return self._backend.get_ultrasound_pulse_us(
+            self._gpio_trigger.identifier,
+            self._gpio_echo.identifier,
+        )
+
     def distance(self) -> Optional[float]:
         """
         Send a pulse and return the distance to the object.
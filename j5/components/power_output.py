@@ -1,7 +1,7 @@
 """Classes for supporting toggleable power output channels."""
 
 from abc import abstractmethod
-from typing import Iterator, Mapping, Type, TypeVar
+from typing import Dict, Iterable, Iterator, List, Mapping, Type, TypeVar
 
 from j5.components.component import Component, Interface
 
@@ -31,6 +31,21 @@ class PowerOutputInterface(Interface):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def set_power_outputs_enabled(
+        self, identifiers: Iterable[int], enabled: bool,
+    ) -> None:
+        """
+        Set whether several power outputs are enabled.
+
+        By default each output is set individually. Backends that can change
+        several outputs in a single command should override this.
+
+        :param identifiers: power outputs to enable / disable
+        :param enabled: status of the power outputs.
+        """
+        for identifier in identifiers:
+            self.set_power_output_enabled(identifier, enabled)
+
     @abstractmethod
     def get_power_output_current(self, identifier: int) -> float:
         """
@@ -50,6 +65,8 @@ class PowerOutput(Component):
     measured.
     """
 
+    __slots__ = ("_identifier", "_backend")
+
     def __init__(
         self, identifier: int, backend: PowerOutputInterface,
     ) -> None:
@@ -108,18 +125,33 @@ T = TypeVar('T')
 class PowerOutputGroup:
     """A group of PowerOutputs."""
 
+    __slots__ = ("_outputs",)
+
     def __init__(self, outputs: Mapping[T, PowerOutput]):
         self._outputs = outputs
 
     def power_on(self) -> None:
         """Enable all outputs in the group."""
-        for output in self._outputs.values():
-            output.is_enabled = True
+        self._set_enabled(True)
 
     def power_off(self) -> None:
         """Disable all outputs in the group."""
+        self._set_enabled(False)
+
+    def _set_enabled(self, enabled: bool) -> None:
+        """
+        Set whether all outputs in the group are enabled.
+
+        Outputs are updated with a single call to each backend.
+
+        :param enabled: status of the outputs.
+        """
+        identifiers: Dict[PowerOutputInterface, List[int]] = {}
         for output in self._outputs.values():
-            output.is_enabled = False
+            identifiers.setdefault(output._backend, []).append(output.identifier)
+
+        for backend, backend_identifiers in identifiers.items():
+            backend.set_power_outputs_enabled(backend_identifiers, enabled)
 
     def __getitem__(self, index: T) -> PowerOutput:
         """
@@ -11,6 +11,14 @@ from j5.components.gpio_pin import GPIOPinMode
 from tests.backends.console.helpers import MockConsole
 
 
+def make_backend() -> SBArduinoConsoleBackend:
+    """Instantiate an SBArduinoConsoleBackend with a MockConsole."""
+    return SBArduinoConsoleBackend(
+        "TestBoard",
+        console_class=MockConsole,
+    )
+
+
 def test_backend_initialisation() -> None:
     """Test that we can initialise a Backend."""
     backend = SBArduinoConsoleBackend("test")
@@ -45,10 +53,7 @@ def test_backend_firmware_version() -> None:
 
 def test_set_gpio_pin_mode() -> None:
     """Test that we can set the mode of a GPIO pin."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.expects = "Set pin 10 to DIGITAL_OUTPUT"  # type: ignore
     backend.set_gpio_pin_mode(10, GPIOPinMode.DIGITAL_OUTPUT)
@@ -62,10 +67,7 @@ def test_set_gpio_pin_mode() -> None:
 
 def test_get_gpio_pin_mode() -> None:
     """Test that we can get the mode of a GPIO Pin."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     assert backend.get_gpio_pin_mode(2) == GPIOPinMode.DIGITAL_OUTPUT
 
@@ -78,10 +80,7 @@ def test_get_gpio_pin_mode() -> None:
 
 def test_write_gpio_pin_digital_state() -> None:
     """Test that we can write a digital state."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.expects = "Set pin 10 state to True"  # type: ignore
     backend.write_gpio_pin_digital_state(10, True)
@@ -92,10 +91,7 @@ def test_write_gpio_pin_digital_state() -> None:
 
 def test_write_gpio_pin_digital_state_bad_mode() -> None:
     """Test that we cannot write a digital state in the wrong mode."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._pins[4].mode = GPIOPinMode.DIGITAL_INPUT_PULLDOWN
 
@@ -105,10 +101,7 @@ def test_write_gpio_pin_digital_state_bad_mode() -> None:
 
 def test_get_gpio_pin_digital_state() -> None:
     """Test that we can get a digital state."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._pins[10].digital_state = False
     assert not backend.get_gpio_pin_digital_state(10)
@@ -119,10 +112,7 @@ def test_get_gpio_pin_digital_state() -> None:
 
 def test_get_gpio_pin_digital_state_bad_mode() -> None:
     """Test that we cannot get a digital state in the wrong mode."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._pins[4].mode = GPIOPinMode.DIGITAL_INPUT_PULLDOWN
 
@@ -132,10 +122,7 @@ def test_get_gpio_pin_digital_state_bad_mode() -> None:
 
 def test_read_gpio_pin_digital_state() -> None:
     """Test that we can read the digital state of a pin."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._pins[10].mode = GPIOPinMode.DIGITAL_INPUT
     backend._console.next_input = "True"  # type: ignore
@@ -144,10 +131,7 @@ def test_read_gpio_pin_digital_state() -> None:
 
 def test_read_gpio_pin_digital_state_bad_mode() -> None:
     """Test that we cannot read a digital state in the wrong mode."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.next_input = "True"  # type: ignore
 
@@ -157,10 +141,7 @@ def test_read_gpio_pin_digital_state_bad_mode() -> None:
 
 def test_read_gpio_pin_analogue_value() -> None:
     """Test that we can read an analogue value."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.next_input = "4.3"  # type: ignore
     backend._pins[5].mode = GPIOPinMode.ANALOGUE_INPUT
@@ -169,10 +150,7 @@ def test_read_gpio_pin_analogue_value() -> None:
 
 def test_read_gpio_pin_analogue_value_bad_mode() -> None:
     """Test that we cannot read an analogue value in the wrong mode."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.next_input = "4.3"  # type: ignore
     with pytest.raises(ValueError):
@@ -197,10 +175,7 @@ def test_write_gpio_pin_pwm_value() -> None:
 
 def test_get_led_state() -> None:
     """Test that we can get the LED state."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
     assert not backend.get_led_state(0)
 
     backend._pins[13].digital_state = True
@@ -209,10 +184,7 @@ def test_get_led_state() -> None:
 
 def test_set_led_state() -> None:
     """Test that we can set the LED state."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.expects = "Set pin 13 state to False"  # type: ignore
     backend.set_led_state(0, False)
@@ -225,10 +197,7 @@ def test_set_led_state() -> None:
 
 def test_that_led_is_pin_13() -> None:
     """Test that the LED has the same state as Pin 13."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
     backend._console.expects = "Set pin 13 state to False"  # type: ignore
     backend.set_led_state(0, False)
 
@@ -247,10 +216,7 @@ def test_one_led() -> None:
 
 def test_get_servo_position() -> None:
     """Test that we can get position of a servo."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
     assert backend.get_servo_position(0) is None
 
     # Override value in backend
@@ -260,10 +226,7 @@ def test_get_servo_position() -> None:
 
 def test_set_servo_position() -> None:
     """Test that we can set position of a servo."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
     backend._console.expects = "Set servo 0 to None"  # type: ignore
     backend.set_servo_position(0, None)
 
@@ -273,10 +236,7 @@ def test_set_servo_position() -> None:
 
 def test_get_ultrasound_position() -> None:
     """Test that we can get the mode of a GPIO Pin."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
     assert backend.get_servo_position(0) is None
 
     # Override value in backend
@@ -286,10 +246,7 @@ def test_get_ultrasound_position() -> None:
 
 def test_ultrasound_pulse() -> None:
     """Test that we can read an ultrasound pulse time."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.next_input = "2345"  # type: ignore
     assert backend.get_ultrasound_pulse(3, 4) == timedelta(microseconds=2345)
@@ -302,10 +259,7 @@ def test_ultrasound_pulse() -> None:
 
 def test_ultrasound_pulse_on_same_pin() -> None:
     """Test same pin for trigger and echo."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.next_input = "2345"  # type: ignore
     assert backend.get_ultrasound_pulse(3, 3) == timedelta(microseconds=2345)
@@ -316,10 +270,7 @@ def test_ultrasound_pulse_on_same_pin() -> None:
 
 def test_ultrasound_distance() -> None:
     """Test that we can read an ultrasound distance."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.next_input = "1.23"  # type: ignore
     metres = backend.get_ultrasound_distance(3, 4)
@@ -334,10 +285,7 @@ def test_ultrasound_distance() -> None:
 
 def test_ultrasound_distance_on_same_pin() -> None:
     """Test same pin for trigger and echo."""
-    backend = SBArduinoConsoleBackend(
-        "TestBoard",
-        console_class=MockConsole,
-    )
+    backend = make_backend()
 
     backend._console.next_input = "1.23"  # type: ignore
     metres = backend.get_ultrasound_distance(3, 3)
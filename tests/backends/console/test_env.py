@@ -9,6 +9,7 @@ def test_console_instantiation() -> None:
 
     assert type(console) is Console
     assert console._descriptor == "MockConsole"
+    assert not hasattr(console, "__dict__")
 
 
 def test_console_info() -> None:
@@ -34,11 +35,11 @@ def test_console_read() -> None:
 
         def _input(self, prompt: str) -> str:
             """Mock some input."""
-            return str(reversed(prompt))
+            return prompt[::-1]
 
     console = MockInputConsole("TestBoard")
 
-    assert str(console.read("Enter Test Input")) == str(reversed("Enter Test Input"))
+    assert console.read("Enter Test Input") == "TestBoard: Enter Test Input: "[::-1]
 
 
 def test_console_read_none_type() -> None:
@@ -132,3 +133,16 @@ def test_console_handle_boolean_correctly() -> None:
     assert val
 
     assert console.is_finished
+
+
+def test_console_custom_input_skips_stdin_check() -> None:
+    """Test that bools are read from a custom input even if stdin is not a tty."""
+
+    class MockConsoleBoolean(Console):
+        """A mock console that does not read from stdin."""
+
+        def _input(self, prompt: str) -> str:
+            """Mock some input."""
+            return "yes"
+
+    assert MockConsoleBoolean("TestConsole").read("I want a bool", bool) is True
@@ -3,14 +3,19 @@
 import logging
 from datetime import timedelta
 from math import pi
+from threading import Lock, Thread
 from typing import List, Optional, Set, Tuple, Type, cast
 
 import pytest
 from serial import Serial
 from serial.tools.list_ports_common import ListPortInfo
 
+from j5.backends import CommunicationError
 from j5.backends.hardware import NotSupportedByHardwareError
-from j5.backends.hardware.j5.arduino import ArduinoHardwareBackend
+from j5.backends.hardware.j5.arduino import (
+    FIRST_DIGITAL_PIN,
+    ArduinoHardwareBackend,
+)
 from j5.boards import Board
 from j5.boards.arduino import ArduinoUno
 from j5.components import GPIOPinMode
@@ -20,6 +25,8 @@ from tests.backends.hardware.j5.mock_serial import MockSerial
 EDGE_ANALOGUE_PIN = ArduinoUno.FIRST_ANALOGUE_PIN
 EDGE_DIGITAL_PIN = EDGE_ANALOGUE_PIN - 1
 
+LockType = type(Lock())
+
 
 class MockArduinoBackend(ArduinoHardwareBackend):
     """A simple backend overriding ArduinoHardwareBackend's abstract methods."""
@@ -51,8 +58,8 @@ class MockArduinoBackend(ArduinoHardwareBackend):
         """Write the stored value of a digital pin to the Arduino."""
         self._serial.write(update_digital_pin_command(
             identifier,
-            self._digital_pins[identifier].mode,
-            self._digital_pins[identifier].state,
+            self.get_gpio_pin_mode(identifier),
+            bool(self._pin_states[identifier - FIRST_DIGITAL_PIN]),
         ))
 
     def _read_digital_pin(self, identifier: int) -> bool:
@@ -140,10 +147,15 @@ def test_backend_is_arduino() -> None:
     )
 
 
-def discover_arduinos(ports: List[ListPortInfo]) -> Set[Board]:
+def discover_arduinos(
+        ports: List[ListPortInfo],
+        thread_safe: bool = True,
+) -> Set[Board]:
     """Mock function for arduino discovery."""
     class MockDiscoveryArduinoBackend(MockArduinoBackend):
 
+        THREAD_SAFE = thread_safe
+
         @classmethod
         def get_comports(cls) -> List[ListPortInfo]:
             return ports
@@ -185,6 +197,17 @@ def test_backend_discover() -> None:
     )
 
 
+def test_backend_discover_serial_numbers() -> None:
+    """Test that each discovered board keeps the serial number of its port."""
+    arduino_ports: List[ListPortInfo] = [
+        make_port_info(vid, pid, serial_number=f"SERIAL{i}")
+        for i, (vid, pid) in enumerate(ArduinoHardwareBackend.USB_IDS)
+    ]
+    assert {
+        board.serial_number for board in discover_arduinos(arduino_ports)
+    } == {port.serial_number for port in arduino_ports}
+
+
 def test_backend_discover_no_serial_number(  # type: ignore[no-untyped-def]
     caplog,
 ) -> None:
@@ -203,15 +226,75 @@ def test_backend_discover_no_serial_number(  # type: ignore[no-untyped-def]
     ]
 
 
+def test_backend_discover_closes_ports_on_failure() -> None:
+    """Test that discovery closes the ports it opened if a board fails to respond."""
+    arduino_ports: List[ListPortInfo] = [
+        make_port_info(0x2341, 0x0043, serial_number=f"SERIAL{i}") for i in range(3)
+    ]
+    arduino_ports[1].device = "/dev/broken"
+    opened: List[MockSerial] = []
+
+    class MockFailingArduinoBackend(MockArduinoBackend):
+
+        def __init__(self, serial_port: str) -> None:
+            super().__init__(serial_port)
+            if serial_port == "/dev/broken":
+                raise CommunicationError("Arduino is not responding")
+            opened.append(cast(MockSerial, self._serial))
+
+        @classmethod
+        def get_comports(cls) -> List[ListPortInfo]:
+            return arduino_ports
+
+    with pytest.raises(CommunicationError):
+        MockFailingArduinoBackend.discover()
+    assert len(opened) == 2
+    assert not any(serial._is_open for serial in opened)
+
+
 def test_backend_initialisation() -> None:
     """Test that we can initialise an ArduinoHardwareBackend."""
     backend = make_backend()
     assert backend.serial_port == "COM0"
     assert isinstance(backend._serial, MockSerial)
-    assert all(
-        pin.mode is GPIOPinMode.DIGITAL_INPUT for pin in backend._digital_pins.values()
-    )
-    assert all(pin.state is False for pin in backend._digital_pins.values())
+    assert all(mode == GPIOPinMode.DIGITAL_INPUT for mode in backend._pin_modes)
+    assert not any(backend._pin_states)
+
+
+def test_backend_thread_safe() -> None:
+    """Test that the serial lock can be disabled for single-threaded use."""
+    assert isinstance(make_backend()._lock, LockType)
+
+    class SingleThreadedBackend(MockArduinoBackend):
+
+        THREAD_SAFE = False
+
+    backend = SingleThreadedBackend("COM0")
+    assert not isinstance(backend._lock, LockType)
+    with backend._lock:
+        backend.set_gpio_pin_mode(2, GPIOPinMode.DIGITAL_OUTPUT)
+    assert backend.get_gpio_pin_mode(2) is GPIOPinMode.DIGITAL_OUTPUT
+
+    # Discovered boards use the setting of the backend class.
+    port = make_port_info(0x2341, 0x0043)
+    for thread_safe in (True, False):
+        board, = discover_arduinos([port], thread_safe=thread_safe)
+        discovered = cast(ArduinoHardwareBackend, cast(ArduinoUno, board)._backend)
+        assert isinstance(discovered._lock, LockType) is thread_safe
+
+
+def test_backend_buffered_write() -> None:
+    """Test that queued data is only written to the serial port when flushed."""
+    backend = make_backend()
+    serial = cast(MockSerial, backend._serial)
+
+    backend._write(b"foo")
+    backend._write(b"bar")
+    serial.check_sent_data(b"")
+    backend._flush()
+    serial.check_sent_data(b"foobar")
+    backend._flush()
+    serial.check_sent_data(b"")
 
 
 def test_backend_get_set_pin_mode() -> None:
@@ -246,6 +329,28 @@ def test_backend_analogue_pin_modes() -> None:
     check_pin_modes(make_backend(), EDGE_ANALOGUE_PIN, legal_modes)
 
 
+def test_backend_serial_pins_not_supported() -> None:
+    """Test that the pins used for serial comms cannot be used as GPIO pins."""
+    backend = make_backend()
+    serial = cast(MockSerial, backend._serial)
+    modes = backend._pin_modes.tolist()
+
+    for pin in (0, 1):
+        with pytest.raises(NotSupportedByHardwareError):
+            backend.set_gpio_pin_mode(pin, GPIOPinMode.DIGITAL_OUTPUT)
+        with pytest.raises(NotSupportedByHardwareError):
+            backend.get_gpio_pin_mode(pin)
+        with pytest.raises(NotSupportedByHardwareError):
+            backend.write_gpio_pin_digital_state(pin, True)
+        with pytest.raises(NotSupportedByHardwareError):
+            backend.get_gpio_pin_digital_state(pin)
+        with pytest.raises(NotSupportedByHardwareError):
+            backend.read_gpio_pin_digital_state(pin)
+
+    assert backend._pin_modes.tolist() == modes
+    serial.check_sent_data(b"")
+
+
 def check_pin_modes(
         backend: ArduinoHardwareBackend,
         pin: ArduinoUno.PinNumber,
@@ -276,6 +381,103 @@ def test_backend_write_digital_state() -> None:
     serial.check_sent_data(update_digital_pin_command(pin, mode, True))
 
 
+def test_backend_batch_digital_state() -> None:
+    """Test that pin updates inside a batch are deferred until the batch ends."""
+    mode = GPIOPinMode.DIGITAL_OUTPUT
+    backend = make_backend()
+    serial = cast(MockSerial, backend._serial)
+
+    with backend.batch():
+        backend.set_gpio_pin_mode(2, mode)
+        backend.set_gpio_pin_mode(3, mode)
+        with backend.batch():
+            backend.write_gpio_pin_digital_state(2, True)
+        serial.check_sent_data(b"")
+        assert backend.get_gpio_pin_digital_state(2) is True
+
+    serial.check_sent_data(b"".join([
+        update_digital_pin_command(2, mode, True),
+        update_digital_pin_command(3, mode, False),
+    ]))
+
+    # Updates are sent immediately again once the batch has finished.
+    backend.write_gpio_pin_digital_state(3, True)
+    serial.check_sent_data(update_digital_pin_command(3, mode, True))
+
+
+def test_backend_batch_discarded_on_error() -> None:
+    """Test that pin updates inside a batch are discarded if the block raises."""
+    mode = GPIOPinMode.DIGITAL_OUTPUT
+    backend = make_backend()
+    serial = cast(MockSerial, backend._serial)
+
+    backend.set_gpio_pin_mode(4, mode)
+    serial.check_sent_data(update_digital_pin_command(4, mode, False))
+
+    with pytest.raises(RuntimeError):
+        with backend.batch():
+            backend.set_gpio_pin_mode(2, mode)
+            backend.write_gpio_pin_digital_state(2, True)
+            backend.write_gpio_pin_digital_state(4, True)
+            raise RuntimeError("Something went wrong")
+    serial.check_sent_data(b"")
+
+    # The stored modes and states still match the board.
+    assert backend.get_gpio_pin_mode(2) is GPIOPinMode.DIGITAL_INPUT
+    assert backend.get_gpio_pin_mode(4) is mode
+    assert backend.get_gpio_pin_digital_state(4) is False
+    assert not any(backend._pin_states)
+
+    # The next batch only sends its own updates.
+    with backend.batch():
+        backend.set_gpio_pin_mode(3, mode)
+    serial.check_sent_data(update_digital_pin_command(3, mode, False))
+
+
+def test_backend_batch_sent_before_read() -> None:
+    """Test that pending pin updates are sent before reading from the board."""
+    backend = make_backend()
+    serial = cast(MockSerial, backend._serial)
+
+    with pytest.raises(RuntimeError):
+        with backend.batch():
+            backend.set_gpio_pin_mode(4, GPIOPinMode.DIGITAL_INPUT_PULLUP)
+            backend.set_gpio_pin_mode(5, GPIOPinMode.DIGITAL_OUTPUT)
+            assert backend.read_gpio_pin_digital_state(4)
+            serial.check_sent_data(b"".join([
+                update_digital_pin_command(4, GPIOPinMode.DIGITAL_INPUT_PULLUP, False),
+                update_digital_pin_command(5, GPIOPinMode.DIGITAL_OUTPUT, False),
+                read_digital_pin_command(4)[0],
+            ]))
+
+            backend.read_gpio_pin_analogue_value(EDGE_ANALOGUE_PIN)
+            serial.check_sent_data(read_analogue_pin_command(EDGE_ANALOGUE_PIN)[0])
+
+            backend.set_gpio_pin_mode(6, GPIOPinMode.DIGITAL_OUTPUT)
+            raise RuntimeError("Something went wrong")
+    serial.check_sent_data(b"")
+
+    # Only the updates that were never sent are rolled back.
+    assert backend.get_gpio_pin_mode(4) is GPIOPinMode.DIGITAL_INPUT_PULLUP
+    assert backend.get_gpio_pin_mode(5) is GPIOPinMode.DIGITAL_OUTPUT
+    assert backend.get_gpio_pin_mode(6) is GPIOPinMode.DIGITAL_INPUT
+
+
+def test_backend_batch_is_per_thread() -> None:
+    """Test that a batch only defers pin updates made by its own thread."""
+    mode = GPIOPinMode.DIGITAL_OUTPUT
+    backend = make_backend()
+    serial = cast(MockSerial, backend._serial)
+
+    with backend.batch():
+        backend.set_gpio_pin_mode(2, mode)
+        thread = Thread(target=backend.set_gpio_pin_mode, args=(3, mode))
+        thread.start()
+        thread.join()
+        serial.check_sent_data(update_digital_pin_command(3, mode, False))
+    serial.check_sent_data(update_digital_pin_command(2, mode, False))
+
+
 def test_backend_write_digital_state_requires_pin_mode() -> None:
     """Check that pin must be in DIGITAL_OUTPUT mode for write digital state to work."""
     pin = 2
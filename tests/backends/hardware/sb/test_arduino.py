@@ -1,5 +1,7 @@
 """Tests for the SourceBots Arduino hardware implementation."""
 
+import logging
+from collections import Counter
 from datetime import timedelta
 from math import isclose
 from typing import List, Optional, Type, cast
@@ -9,6 +11,7 @@ from serial import Serial, SerialException, SerialTimeoutException
 
 from j5.backends import CommunicationError
 from j5.backends.hardware.env import NotSupportedByHardwareError
+from j5.backends.hardware.j5.arduino import FIRST_DIGITAL_PIN
 from j5.backends.hardware.sb.arduino import SBArduinoHardwareBackend
 from j5.boards.arduino import ArduinoUno
 from j5.components import GPIOPinMode
@@ -47,7 +50,8 @@ class SBArduinoSerial(MockSerial):
 
     def respond_to_write(self, data: bytes) -> None:
         """Hook that can be overriden by subclasses to respond to sent data."""
-        self.append_received_data(b"+ OK", newline=True)
+        for _ in range(data.count(b"\n")):
+            self.append_received_data(b"+ OK", newline=True)
 
     def check_data_sent_by_constructor(self) -> None:
         """Check that the backend constructor sent expected data to the serial port."""
@@ -128,6 +132,34 @@ class SBArduinoSerialFailureResponse(SBArduinoSerial):
         self.append_received_data(b"- Something went wrong", newline=True)
 
 
+class SBArduinoSerialBatchFailureResponse(SBArduinoSerial):
+    """Like SBArduinoSerial, but the first command in a batch fails."""
+
+    def respond_to_write(self, data: bytes) -> None:
+        """Hook that can be overriden by subclasses to respond to sent data."""
+        if data.count(b"\n") > 1:
+            self.append_received_data(b"- Something went wrong", newline=True)
+            for _ in range(data.count(b"\n") - 1):
+                self.append_received_data(b"+ OK", newline=True)
+        else:
+            super().respond_to_write(data)
+
+
+class SBArduinoSerialNoResponse(SBArduinoSerial):
+    """Like SBArduinoSerial, but never responds to commands."""
+
+    readline_count = 0
+
+    def respond_to_write(self, data: bytes) -> None:
+        """Hook that can be overriden by subclasses to respond to sent data."""
+        pass
+
+    def readline(self) -> bytes:
+        """Read up to a newline on the serial port."""
+        self.readline_count += 1
+        return super().readline()
+
+
 class SBArduinoSerialCommentResponse(SBArduinoSerial):
     """Like SBArduinoSerial, but returns a failure response rather than success."""
 
@@ -179,10 +211,8 @@ def test_backend_initialisation() -> None:
     backend = make_backend()
     assert backend.serial_port == "COM0"
     assert isinstance(backend._serial, SBArduinoSerial)
-    assert all(
-        pin.mode is GPIOPinMode.DIGITAL_INPUT for pin in backend._digital_pins.values()
-    )
-    assert all(pin.state is False for pin in backend._digital_pins.values())
+    assert all(mode == GPIOPinMode.DIGITAL_INPUT for mode in backend._pin_modes)
+    assert not any(backend._pin_states)
 
 
 def test_backend_initialisation_serial() -> None:
@@ -254,11 +284,13 @@ def test_backend_handles_serial_exception() -> None:
 
 
 def test_backend_update_digital_pin_requires_digital_pin() -> None:
-    """Test that analogue pins are invalid for _update_digital_pin."""
+    """Test that non-digital pins are invalid for _update_digital_pin."""
     backend = make_backend()
 
     with pytest.raises(RuntimeError):
         backend._update_digital_pin(EDGE_ANALOGUE_PIN)
+    with pytest.raises(RuntimeError):
+        backend._update_digital_pin(1)
 
 
 def test_backend_update_digital_pin_requires_pin_mode() -> None:
@@ -266,7 +298,7 @@ def test_backend_update_digital_pin_requires_pin_mode() -> None:
     pin = 2
     backend = make_backend()
 
-    backend._digital_pins[pin].mode = GPIOPinMode.ANALOGUE_INPUT
+    backend._pin_modes[pin - FIRST_DIGITAL_PIN] = GPIOPinMode.ANALOGUE_INPUT
     with pytest.raises(RuntimeError):
         backend._update_digital_pin(pin)
 
@@ -308,6 +340,65 @@ def test_backend_digital_state_persists() -> None:
     serial.check_all_received_data_consumed()
 
 
+def test_backend_batch_digital_state() -> None:
+    """Test that pin updates inside a batch are sent in a single write."""
+    backend = make_backend()
+    serial = cast(SBArduinoSerial, backend._serial)
+    serial.check_data_sent_by_constructor()
+    with backend.batch():
+        backend.set_gpio_pin_mode(2, GPIOPinMode.DIGITAL_OUTPUT)
+        backend.set_gpio_pin_mode(3, GPIOPinMode.DIGITAL_INPUT_PULLUP)
+        backend.write_gpio_pin_digital_state(2, True)
+        serial.check_sent_data(b"")
+    serial.check_sent_data(b"W 2 H\nW 3 P\n")
+    serial.check_all_received_data_consumed()
+
+
+def test_backend_batch_handles_failure() -> None:
+    """Test that every response is read when one command in a batch fails."""
+    backend = make_backend(SBArduinoSerialBatchFailureResponse)
+    serial = cast(SBArduinoSerial, backend._serial)
+    serial.check_data_sent_by_constructor()
+    with pytest.raises(CommunicationError):
+        with backend.batch():
+            backend.set_gpio_pin_mode(2, GPIOPinMode.DIGITAL_OUTPUT)
+            backend.set_gpio_pin_mode(3, GPIOPinMode.DIGITAL_OUTPUT)
+    serial.check_sent_data(b"W 2 L\nW 3 L\n")
+    serial.check_all_received_data_consumed()
+
+    # The next command receives its own response.
+    serial.append_received_data(b"> H", newline=True)
+    assert backend.read_gpio_pin_digital_state(4)
+    serial.check_all_received_data_consumed()
+
+
+def test_backend_batch_handles_no_response() -> None:
+    """Test that a batch stops waiting for responses if the board does not respond."""
+    backend = make_backend(SBArduinoSerialNoResponse)
+    serial = cast(SBArduinoSerialNoResponse, backend._serial)
+    serial.check_data_sent_by_constructor()
+    serial.readline_count = 0
+    with pytest.raises(CommunicationError):
+        with backend.batch():
+            backend.set_gpio_pin_mode(2, GPIOPinMode.DIGITAL_OUTPUT)
+            backend.set_gpio_pin_mode(3, GPIOPinMode.DIGITAL_OUTPUT)
+    assert serial.readline_count == 1
+
+
+def test_backend_failed_batch_not_sent() -> None:
+    """Test that a batch that fails to queue is not sent with the next command."""
+    backend = make_backend()
+    serial = cast(SBArduinoSerial, backend._serial)
+    serial.check_data_sent_by_constructor()
+    with pytest.raises(TypeError):
+        backend._commands([["W", "2", "L"], ["W", 3, "L"]])  # type: ignore
+    serial.check_sent_data(b"")
+
+    backend.set_gpio_pin_mode(2, GPIOPinMode.DIGITAL_INPUT)
+    serial.check_sent_data(b"W 2 Z\n")
+    serial.check_all_received_data_consumed()
+
+
 def test_backend_input_modes() -> None:
     """Check that the correct commands are send when setting pins to input modes."""
     backend = make_backend()
@@ -451,6 +542,33 @@ def test_ultrasound_pulse() -> None:
     serial.check_all_received_data_consumed()
 
 
+def test_ultrasound_pulse_us(caplog) -> None:  # type: ignore[no-untyped-def]
+    """Test that we can read an ultrasound pulse time in microseconds."""
+    backend = make_backend()
+    serial = cast(SBArduinoSerial, backend._serial)
+    serial.check_data_sent_by_constructor()
+
+    caplog.set_level(logging.DEBUG)
+    serial.append_received_data(b"> 2345\n")
+    duration = backend.get_ultrasound_pulse_us(3, 4)
+    serial.check_sent_data(b"T 3 4\n")
+    assert duration == 2345
+
+    # Each reading is only logged by the method that was called.
+    serial.append_received_data(b"> 2345\n")
+    backend.get_ultrasound_pulse(3, 4)
+    serial.check_sent_data(b"T 3 4\n")
+    methods = Counter(message.split("(")[0] for _, _, message in caplog.record_tuples)
+    assert methods.keys() == {"get_ultrasound_pulse_us", "get_ultrasound_pulse"}
+    assert methods["get_ultrasound_pulse_us"] == methods["get_ultrasound_pulse"]
+
+    serial.append_received_data(b"> 0\n")
+    assert backend.get_ultrasound_pulse_us(3, 4) is None
+    serial.check_sent_data(b"T 3 4\n")
+
+    serial.check_all_received_data_consumed()
+
+
 def test_ultrasound_pulse_on_same_pin() -> None:
     """Test same pin for trigger and echo."""
     backend = make_backend()
@@ -1,12 +1,13 @@
 """Tests for the Student Robotics Ruggeduino hardware implementation."""
 from math import isclose
-from typing import Optional, Type, cast
+from typing import List, Optional, Type, cast
 
 import pytest
 from serial import Serial, SerialException, SerialTimeoutException
 
 from j5.backends import CommunicationError
 from j5.backends.hardware import NotSupportedByHardwareError
+from j5.backends.hardware.j5.arduino import FIRST_DIGITAL_PIN
 from j5.backends.hardware.sr.v4 import SRV4RuggeduinoHardwareBackend
 from j5.boards.arduino import ArduinoUno
 from j5.components import GPIOPinMode
@@ -100,10 +101,8 @@ def test_backend_initialisation() -> None:
     backend = make_backend()
     assert backend.serial_port == "COM0"
     assert isinstance(backend._serial, RuggeduinoSerial)
-    assert all(
-        pin.mode is GPIOPinMode.DIGITAL_INPUT for pin in backend._digital_pins.values()
-    )
-    assert all(pin.state is False for pin in backend._digital_pins.values())
+    assert all(mode == GPIOPinMode.DIGITAL_INPUT for mode in backend._pin_modes)
+    assert not any(backend._pin_states)
 
 
 def test_backend_initialisation_serial() -> None:
@@ -117,6 +116,22 @@ def test_backend_initialisation_serial() -> None:
         make_backend(RuggeduinoSerialNoBoot)
 
 
+def test_backend_initialisation_single_write() -> None:
+    """Test that the constructor sets up the digital pins in a single write."""
+    writes: List[bytes] = []
+
+    class RecordingRuggeduinoSerial(RuggeduinoSerial):
+        """Like RuggeduinoSerial, but records each write."""
+
+        def write(self, data: bytes) -> int:
+            """Write the data to the serial port."""
+            writes.append(data)
+            return super().write(data)
+
+    make_backend(RecordingRuggeduinoSerial)
+    assert writes == [b"v", b"icidieifigihiiijikilimin"]
+
+
 def test_backend_version_check() -> None:
     """Test that an exception is raised if the arduino reports an unsupported version."""
     with pytest.raises(CommunicationError):
@@ -162,11 +177,13 @@ def test_backend_encode_pin() -> None:
 
 
 def test_backend_update_digital_pin_requires_digital_pin() -> None:
-    """Test that analogue pins are invalid for _update_digital_pin."""
+    """Test that non-digital pins are invalid for _update_digital_pin."""
     backend = make_backend()
 
     with pytest.raises(RuntimeError):
         backend._update_digital_pin(EDGE_ANALOGUE_PIN)
+    with pytest.raises(RuntimeError):
+        backend._update_digital_pin(1)
 
 
 def test_backend_update_digital_pin_requires_pin_mode() -> None:
@@ -174,7 +191,7 @@ def test_backend_update_digital_pin_requires_pin_mode() -> None:
     pin = 2
     backend = make_backend()
 
-    backend._digital_pins[pin].mode = GPIOPinMode.ANALOGUE_INPUT
+    backend._pin_modes[pin - FIRST_DIGITAL_PIN] = GPIOPinMode.ANALOGUE_INPUT
     with pytest.raises(RuntimeError):
         backend._update_digital_pin(pin)
 
@@ -251,6 +268,34 @@ def test_backend_digital_state_persists() -> None:
     serial.check_all_received_data_consumed()
 
 
+def test_backend_batch_digital_state() -> None:
+    """Test that pin updates inside a batch are sent in a single write."""
+    backend = make_backend()
+    serial = cast(RuggeduinoSerial, backend._serial)
+    serial.check_data_sent_by_constructor()
+    with backend.batch():
+        backend.set_gpio_pin_mode(2, GPIOPinMode.DIGITAL_OUTPUT)
+        backend.set_gpio_pin_mode(3, GPIOPinMode.DIGITAL_INPUT_PULLUP)
+        backend.write_gpio_pin_digital_state(2, True)
+        serial.check_sent_data(b"")
+    serial.check_sent_data(b"ochcpd")
+    serial.check_all_received_data_consumed()
+
+
+def test_backend_failed_batch_not_sent() -> None:
+    """Test that a batch that fails to queue is not sent with the next command."""
+    backend = make_backend()
+    serial = cast(RuggeduinoSerial, backend._serial)
+    serial.check_data_sent_by_constructor()
+    with pytest.raises(AttributeError):
+        backend._execute_raw_string_commands(["oc", 3])  # type: ignore
+    serial.check_sent_data(b"")
+
+    backend.set_gpio_pin_mode(2, GPIOPinMode.DIGITAL_INPUT)
+    serial.check_sent_data(b"ic")
+    serial.check_all_received_data_consumed()
+
+
 def test_backend_input_modes() -> None:
     """Check that the correct commands are send when setting pins to input modes."""
     pin = 2
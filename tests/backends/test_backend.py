@@ -1,14 +1,15 @@
 """Tests for the base backend classes."""
 
+import logging
 from typing import TYPE_CHECKING, Optional, Set, Type
 
 import pytest
 
 from j5.backends import Backend
 from j5.boards import Board
-from j5.components import LED
+from j5.components import LED, PowerOutput, PowerOutputInterface
 
-from .utils import MockBackend
+from .utils import MockBackend, MockBoard
 
 if TYPE_CHECKING:
     from j5.components import Component  # noqa
@@ -59,3 +60,36 @@ def test_backend_has_required_interface() -> None:
             @property
             def firmware_version(self) -> Optional[str]:
                 return None
+
+
+def test_backend_logs_optional_interface_methods(  # type: ignore[no-untyped-def]
+    caplog,
+) -> None:
+    """Test that interface methods with a default implementation are also logged."""
+    class PowerOutputMockBoard(MockBoard):
+        """A test board."""
+
+        @staticmethod
+        def supported_components() -> Set[Type["Component"]]:
+            """List the types of component supported by this Board."""
+            return {PowerOutput}
+
+    class PowerOutputMockBackend(PowerOutputInterface, MockBackend):
+        board = PowerOutputMockBoard
+
+        def get_power_output_enabled(self, identifier: int) -> bool:
+            return False
+
+        def set_power_output_enabled(self, identifier: int, enabled: bool) -> None:
+            pass
+
+        def get_power_output_current(self, identifier: int) -> float:
+            return 0.0
+
+    caplog.set_level(logging.DEBUG)
+    PowerOutputMockBackend().set_power_outputs_enabled([0], True)
+    assert (
+        "j5.components.power_output",
+        logging.DEBUG,
+        "set_power_outputs_enabled(identifiers=[0], enabled=True)",
+    ) in caplog.record_tuples
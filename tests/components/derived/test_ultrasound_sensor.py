@@ -80,6 +80,10 @@ def test_ultrasound_sensor() -> None:
     assert type(time) is timedelta
     assert time.microseconds == 20000
 
+    time_us = u.pulse_us()
+    assert type(time_us) is int
+    assert time_us == 20000
+
     dist = u.distance()
     assert dist is not None
     assert type(dist) is float
@@ -1,4 +1,6 @@
 """Tests for the power output classes."""
+from typing import Iterable, List
+
 from j5.components.power_output import (
     PowerOutput,
     PowerOutputGroup,
@@ -85,6 +87,34 @@ def test_power_output_group_power_toggle() -> None:
     assert not any(output.is_enabled for output in group)
 
 
+def test_power_output_group_power_toggle_batched() -> None:
+    """Test that a PowerOutputGroup updates all outputs with one backend call."""
+
+    class MockBatchPowerOutputDriver(MockPowerOutputDriver):
+        """A testing driver that records batched updates."""
+
+        def __init__(self, output_quantity: int = 5) -> None:
+            super().__init__(output_quantity)
+            self.batches: List[List[int]] = []
+
+        def set_power_outputs_enabled(
+            self, identifiers: Iterable[int], enabled: bool,
+        ) -> None:
+            """Set whether several power outputs are enabled."""
+            identifiers = list(identifiers)
+            self.batches.append(identifiers)
+            super().set_power_outputs_enabled(identifiers, enabled)
+
+    backend = MockBatchPowerOutputDriver()
+    group = PowerOutputGroup({i: PowerOutput(i, backend) for i in range(0, 5)})
+
+    group.power_on()
+    assert all(output.is_enabled for output in group)
+    group.power_off()
+    assert not any(output.is_enabled for output in group)
+    assert backend.batches == [[0, 1, 2, 3, 4], [0, 1, 2, 3, 4]]
+
+
 def test_power_output_group_len() -> None:
     """Test the length attribute of PowerOutputGroup."""
     outputs = {i: PowerOutput(i, MockPowerOutputDriver()) for i in range(0, 5)}